@@ -0,0 +1,44 @@
+"""
+Elo Kernels (compiled with Numba when available)
+"""
+
+import numpy as np
+
+# Optional numba: without it the kernels run as plain Python on NumPy arrays
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True)
+def replay(idx_a, idx_b, result, init_ratings, k):
+    """
+    Replay matches in order and return the final ratings.
+    idx_a / idx_b index into init_ratings; result is relative to A
+    (1.0 => A wins, 0.0 => B wins, 0.5 => draw).
+    """
+    ratings = init_ratings.copy()
+    for i in range(len(result)):
+        ra = ratings[idx_a[i]]
+        rb = ratings[idx_b[i]]
+        qa = 10.0 ** (ra / 400.0)
+        qb = 10.0 ** (rb / 400.0)
+        ea = qa / (qa + qb)
+        ratings[idx_a[i]] = ra + k * (result[i] - ea)
+        ratings[idx_b[i]] = rb + k * ((1.0 - result[i]) - (1.0 - ea))
+    return ratings
+
+
+def warmup():
+    """Compile replay() on a tiny input, so the first real rebuild doesn't pay for the JIT."""
+    if not NUMBA_AVAILABLE:
+        return
+    idx = np.zeros(1, dtype=np.int64)
+    replay(idx, idx, np.ones(1, dtype=np.float64), np.zeros(1, dtype=np.float64), 1.0)